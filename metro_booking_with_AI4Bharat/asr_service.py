@@ -6,11 +6,12 @@ Simple, robust speech-to-text conversion with multilingual support
 import speech_recognition as sr
 import librosa
 import soundfile as sf
-import tempfile
+import io
 import os
+import tempfile
 import requests
 import json
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 class SpeechRecognition:
     """Real speech recognition using multiple APIs"""
@@ -35,23 +36,25 @@ class SpeechRecognition:
         # AI4Bharat API (fallback for Indian languages)
         self.ai4bharat_url = "https://api.ai4bharat.org/asr"
         
-    def transcribe(self, audio_path: str, language: str = 'en') -> str:
+    def transcribe(self, audio_source: Union[str, BinaryIO], language: str = 'en') -> str:
         """
         Transcribe audio file to text
         
         Args:
-            audio_path: Path to audio file
+            audio_source: Path to audio file, or a seekable binary file object
+                          (e.g. io.BytesIO) holding the audio in memory
             language: Language code (en, hi, kn, ta, te)
             
         Returns:
             Transcribed text
         """
         try:
-            print(f"🎤 Processing audio: {os.path.basename(audio_path)}")
+            source_name = os.path.basename(audio_source) if isinstance(audio_source, str) else 'in-memory audio'
+            print(f"🎤 Processing audio: {source_name}")
             print(f"🌍 Language: {language}")
             
             # Convert and prepare audio
-            audio_data = self._prepare_audio(audio_path)
+            audio_data = self._prepare_audio(audio_source)
             if not audio_data:
                 return self._get_sample_text(language)
             
@@ -63,7 +66,7 @@ class SpeechRecognition:
             
             # Try AI4Bharat for Indian languages
             if language != 'en':
-                transcription = self._transcribe_with_ai4bharat(audio_path, language)
+                transcription = self._transcribe_with_ai4bharat(audio_source, language)
                 if transcription:
                     print(f"✅ AI4Bharat ASR: '{transcription}'")
                     return transcription
@@ -76,32 +79,54 @@ class SpeechRecognition:
             print(f"❌ Speech recognition error: {e}")
             return self._get_sample_text(language)
     
-    def _prepare_audio(self, audio_path: str) -> Optional[sr.AudioData]:
+    def _prepare_audio(self, audio_source: Union[str, BinaryIO]) -> Optional[sr.AudioData]:
         """Prepare audio for recognition"""
         try:
             # First try direct loading
             try:
-                with sr.AudioFile(audio_path) as source:
+                with sr.AudioFile(audio_source) as source:
                     self.recognizer.adjust_for_ambient_noise(source, duration=0.2)
                     return self.recognizer.record(source)
             except:
-                # Convert using librosa if needed
-                y, sr_rate = librosa.load(audio_path, sr=16000)
+                # Convert using librosa if needed, rewinding a stream the first attempt read from
+                if not isinstance(audio_source, str):
+                    audio_source.seek(0)
+                y = self._load_audio(audio_source)
                 
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                    sf.write(temp_file.name, y, 16000)
-                    
-                    with sr.AudioFile(temp_file.name) as source:
-                        self.recognizer.adjust_for_ambient_noise(source, duration=0.2)
-                        audio_data = self.recognizer.record(source)
-                    
-                    os.unlink(temp_file.name)
-                    return audio_data
+                # Re-encode as 16 kHz WAV in memory rather than through a temp file
+                wav_buffer = io.BytesIO()
+                sf.write(wav_buffer, y, 16000, format='WAV')
+                wav_buffer.seek(0)
+                
+                with sr.AudioFile(wav_buffer) as source:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=0.2)
+                    return self.recognizer.record(source)
                     
         except Exception as e:
             print(f"⚠️ Audio preparation failed: {e}")
             return None
     
+    def _load_audio(self, audio_source: Union[str, BinaryIO]):
+        """Decode audio to a 16 kHz mono signal with librosa"""
+        try:
+            y, sr_rate = librosa.load(audio_source, sr=16000)
+            return y
+        except sf.SoundFileRuntimeError:
+            if isinstance(audio_source, str):
+                raise
+        
+        # soundfile can't read containers like the webm browsers record with
+        # MediaRecorder, and librosa only falls back to audioread/ffmpeg for
+        # paths, so write just these streams to a temporary file
+        audio_source.seek(0)
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(audio_source.read())
+        try:
+            y, sr_rate = librosa.load(temp_file.name, sr=16000)
+            return y
+        finally:
+            os.unlink(temp_file.name)
+    
     def _transcribe_with_google(self, audio_data: sr.AudioData, language: str) -> Optional[str]:
         """Transcribe using Google Speech Recognition"""
         try:
@@ -117,7 +142,7 @@ class SpeechRecognition:
             print(f"⚠️ Google ASR failed: {e}")
             return None
     
-    def _transcribe_with_ai4bharat(self, audio_path: str, language: str) -> Optional[str]:
+    def _transcribe_with_ai4bharat(self, audio_source: Union[str, BinaryIO], language: str) -> Optional[str]:
         """Transcribe using AI4Bharat API (simulated for now)"""
         try:
             # This would be the actual AI4Bharat API call
@@ -5,21 +5,21 @@ Simple Flask web application for voice-based metro ticket booking
 """
 
 from flask import Flask, render_template, request, jsonify
-import os
+import io
+import functools
 import uuid
-import tempfile
 from asr_service import SpeechRecognition
-from language_processor import LanguageProcessor
+from language_processor import get_language_processor, METRO_STATIONS as PROCESSOR_STATIONS
 
 app = Flask(__name__)
 app.secret_key = 'metro-booking-secret-key'
 
 # Initialize services
 speech_service = SpeechRecognition()
-language_service = LanguageProcessor()
+language_service = get_language_processor()
 
-# Metro stations data
-METRO_STATIONS = [
+# Metro stations data (deduplicated in listing order, since lines share interchange stations)
+METRO_STATIONS = tuple(dict.fromkeys([
     "Majestic", "City Railway Station", "Magadi Road", "Hosahalli",
     "Vijayanagar", "Attiguppe", "Deepanjali Nagar", "Mysore Road",
     "Nayandahalli", "Rajarajeshwari Nagar", "Jnanabharathi",
@@ -55,17 +55,36 @@ METRO_STATIONS = [
     "Whitefield", "Kadugodi", "Channasandra", "Hoodi", "Garudacharpalya",
     "Domlur", "Indiranagar", "Swami Vivekananda Road", "Kalyan Nagar",
     "Nagawara", "Thanisandra", "Hebbal", "Kempegowda International Airport"
-]
+]))
+
+# The station list never changes, so /api/stations serves JSON encoded once at startup
+STATIONS_JSON = app.json.dumps({'stations': METRO_STATIONS})
+
+# Station positions used as a distance stand-in for pricing: the listed stations,
+# then any others the language processor can extract, so every booking has an index
+STATION_INDEX = {station: index for index, station in enumerate(dict.fromkeys(METRO_STATIONS + PROCESSOR_STATIONS))}
 
 @app.route('/')
 def index():
     """Main page"""
+    # Browsers must revalidate on every load so a deploy is picked up at once,
+    # but an unchanged page costs only a 304 thanks to the ETag
+    response = app.response_class(_render_index(), mimetype='text/html')
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
+
+@functools.cache
+def _render_index():
+    """Render the main page once, or the inline fallback page if the template fails"""
     try:
         return render_template('index.html', stations=METRO_STATIONS)
     except Exception as e:
         print(f"Template error: {e}")
         # Return simple HTML if template fails
-        return '''
+        return _FALLBACK_INDEX
+
+_FALLBACK_INDEX = '''
         <!DOCTYPE html>
         <html>
         <head>
@@ -281,16 +300,13 @@ def transcribe_audio():
         if audio_file.filename == '':
             return jsonify({'error': 'No audio file selected'}), 400
         
-        # Save audio temporarily
-        temp_dir = tempfile.gettempdir()
-        audio_filename = f"audio_{uuid.uuid4().hex[:8]}.wav"
-        audio_path = os.path.join(temp_dir, audio_filename)
-        audio_file.save(audio_path)
+        # Keep the upload in memory instead of round-tripping it through a temp file
+        audio_stream = io.BytesIO(audio_file.read())
         
         print("🎤 Transcribing audio with auto-detection")
         
         # Transcribe using speech recognition (use English as base, then detect from text)
-        transcription = speech_service.transcribe(audio_path, 'en')
+        transcription = speech_service.transcribe(audio_stream, 'en')
         
         # Auto-detect language from transcription
         detected_language = language_service.detect_language(transcription)
@@ -300,9 +316,6 @@ def transcribe_audio():
         native_script_text = language_service.transliterate_to_native_script(transcription, detected_language)
         print(f"🎨 Native script: {native_script_text}")
         
-        # Clean up
-        os.remove(audio_path)
-        
         return jsonify({
             'success': True,
             'transcription': transcription,
@@ -339,7 +352,7 @@ def process_request():
             if from_station and to_station:
                 # Simple pricing: base price + distance factor
                 base_price = 10
-                distance_factor = abs(hash(from_station) % 50 - hash(to_station) % 50)
+                distance_factor = abs(STATION_INDEX[from_station] - STATION_INDEX[to_station])
                 total_price = (base_price + distance_factor) * quantity
                 
                 booking_id = f"BM{uuid.uuid4().hex[:8].upper()}"
@@ -359,7 +372,7 @@ def process_request():
 @app.route('/api/stations', methods=['GET'])
 def get_stations():
     """Get all metro stations"""
-    return jsonify({'stations': METRO_STATIONS})
+    return app.response_class(STATIONS_JSON, mimetype='application/json')
 
 if __name__ == '__main__':
     print("🚇 Starting Bangalore Metro Booking System...")
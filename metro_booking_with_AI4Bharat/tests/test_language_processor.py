@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Test Module for Language Processor
+
+This module contains regression tests for intent detection and entity extraction.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import language_processor
+from language_processor import LanguageProcessor
+
+class TestLanguageProcessor(unittest.TestCase):
+    """Test cases for Language Processor"""
+
+    def setUp(self):
+        """Set up test environment"""
+        # Keep the compiled intent database out of the real user cache
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_dir = cache_dir.name
+        original_cache_dir = language_processor.HYPERSCAN_CACHE_DIR
+        language_processor.HYPERSCAN_CACHE_DIR = self.cache_dir
+        self.addCleanup(setattr, language_processor, 'HYPERSCAN_CACHE_DIR', original_cache_dir)
+        language_processor._intent_database.cache_clear()
+        self.addCleanup(language_processor._intent_database.cache_clear)
+        self.processor = LanguageProcessor()
+
+    def test_station_alias_not_matched_inside_words(self):
+        """Test that a short alias inside a longer phrase doesn't shadow the real station"""
+        result = self.processor.process_text('I need to go to hebbal from the city railway station')
+        self.assertEqual(result['intent'], 'book_ticket')
+        self.assertEqual(result['from_station'], 'Hebbal')
+        self.assertEqual(result['to_station'], 'City Railway Station')
+
+    def test_fast_intent_matches_process_text(self):
+        """Test that the intent-only fast path agrees with full processing"""
+        for text in ('book 2 tickets from majestic to whitefield', 'what is the fare to indiranagar',
+                     'hello there', 'मुझे मैजेस्टिक से व्हाइटफील्ड जाना है'):
+            self.assertEqual(self.processor.fast_intent(text), self.processor.process_text(text)['intent'])
+
+    def _run_concurrently(self, processor):
+        """Process unique booking texts from 8 threads and return any wrong intents"""
+        wrong = []
+
+        def worker(thread_id):
+            for i in range(300):
+                # Unique text per call so every call scans instead of hitting the cache
+                text = f"book {i % 5 + 1} tickets from majestic to whitefield {thread_id} {i}"
+                result = processor.process_text(text, 'en')
+                if result['intent'] != 'book_ticket':
+                    wrong.append((text, result['intent']))
+
+        threads = [threading.Thread(target=worker, args=(thread_id,)) for thread_id in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return wrong
+
+    def test_concurrent_intent_detection(self):
+        """Test that threads processing text at the same time all get the right intent"""
+        self.assertEqual(self._run_concurrently(self.processor), [])
+
+    @unittest.skipUnless(language_processor.HYPERSCAN_AVAILABLE, "hyperscan not installed")
+    def test_concurrent_intent_detection_with_cached_database(self):
+        """Test concurrent scans against an intent database loaded from the disk cache"""
+        # First build writes the cache, the second one loads it
+        language_processor._intent_database()
+        language_processor._intent_database.cache_clear()
+        self.assertEqual(self._run_concurrently(LanguageProcessor()), [])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+if __name__ == '__main__':
+    unittest.main()